@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Check that the Board's cached row masks and column tops stay in sync with its grid."""
+
+import random
+import sys
+
+import numpy as np
+
+import tetris
+
+
+def reference_is_valid(board, piece_type, row, col, rotation):
+    """Cell-by-cell bounds and occupancy check on the grid alone."""
+    for dr, dc in tetris.TETROMINOES[piece_type][rotation]:
+        r, c = row + dr, col + dc
+        if c < 0 or c >= tetris.BOARD_WIDTH or r >= tetris.BOARD_HEIGHT:
+            return False
+        if r >= 0 and board.grid[r, c] != 0:
+            return False
+    return True
+
+
+def reference_drop_distance(board, piece_type, row, col, rotation):
+    """Step the piece down one row at a time until it would collide."""
+    distance = 0
+    while reference_is_valid(board, piece_type, row + distance + 1, col, rotation):
+        distance += 1
+    return distance
+
+
+def check_caches(board):
+    """Compare row_masks and col_tops against values rebuilt from the grid."""
+    occupied = board.grid != 0
+    row_masks = [
+        sum(1 << col for col in range(tetris.BOARD_WIDTH) if occupied[row, col])
+        for row in range(tetris.BOARD_HEIGHT)
+    ]
+    col_tops = [
+        next((row for row in range(tetris.BOARD_HEIGHT) if occupied[row, col]),
+             tetris.BOARD_HEIGHT)
+        for col in range(tetris.BOARD_WIDTH)
+    ]
+    assert board.row_masks == row_masks
+    assert board.col_tops == col_tops
+
+
+def play_random_boards(games=30, seed=1234):
+    """Yield boards built by locking random pieces and clearing lines."""
+    rng = random.Random(seed)
+    for _ in range(games):
+        board = tetris.Board()
+        for _ in range(rng.randrange(20, 80)):
+            piece = tetris.Piece(rng.choice(list(tetris.TETROMINOES)))
+            piece.rotation_index = rng.randrange(4)
+            piece.col = rng.randrange(-2, tetris.BOARD_WIDTH)
+            piece.row = rng.randrange(tetris.BOARD_HEIGHT)
+            if board.is_valid_position(piece.type, piece.row, piece.col, piece.rotation_index):
+                board.lock_piece(piece)
+                board.clear_lines()
+                check_caches(board)
+        yield board
+
+
+def test_line_clear_keeps_caches_in_sync():
+    board = tetris.Board()
+    for piece_type, row, col in [('I', 19, 0), ('I', 19, 4), ('O', 18, 8), ('T', 16, 3)]:
+        piece = tetris.Piece(piece_type)
+        piece.row, piece.col = row, col
+        board.lock_piece(piece)
+
+    assert board.clear_lines() == 1
+    check_caches(board)
+    # Only the O piece's top half and the T piece remain, shifted down one row
+    assert np.count_nonzero(board.grid) == 6
+    assert board.clear_lines() == 0
+
+
+def test_collision_and_drop_match_reference():
+    for board in play_random_boards():
+        for piece_type in tetris.TETROMINOES:
+            for rotation in range(4):
+                for row in range(-2, tetris.BOARD_HEIGHT + 1):
+                    for col in range(-3, tetris.BOARD_WIDTH + 1):
+                        valid = reference_is_valid(board, piece_type, row, col, rotation)
+                        assert board.is_valid_position(piece_type, row, col, rotation) == valid
+                        if valid:
+                            expected = reference_drop_distance(board, piece_type, row, col,
+                                                               rotation)
+                            assert board.drop_distance(piece_type, row, col, rotation) == expected
+
+
+def test_kernel_warm_up_matches_drop_distance_types():
+    # Lock and clear so the grid has been rebuilt by clear_lines
+    board = tetris.Board()
+    for col in range(0, tetris.BOARD_WIDTH, 2):
+        piece = tetris.Piece('O')
+        piece.row, piece.col = tetris.BOARD_HEIGHT - 3, col
+        board.lock_piece(piece)
+    assert board.clear_lines() == 2
+
+    # Horizontal I over columns 0-3, then a vertical I in column 3 under it
+    overhang = tetris.Piece('I')
+    overhang.row, overhang.col = 10, 0
+    board.lock_piece(overhang)
+    assert board.drop_distance('I', 11, 1, 1) == 5
+
+    # Numba compiles one specialization per argument type, which covers
+    # dtype, dimensions and memory layout
+    warm_up_args = (tetris.Board().grid, tetris.kernel_cells('I', 0, 0, 0))
+    game_args = (board.grid, tetris.kernel_cells('T', 11, 1, 2))
+    try:
+        from numba import typeof
+    except ImportError:
+        assert [(a.dtype, a.ndim, a.flags.c_contiguous) for a in warm_up_args] == \
+            [(a.dtype, a.ndim, a.flags.c_contiguous) for a in game_args]
+    else:
+        assert [typeof(a) for a in warm_up_args] == [typeof(a) for a in game_args]
+
+
+if __name__ == "__main__":
+    try:
+        test_line_clear_keeps_caches_in_sync()
+        print("✓ Line clears keep row masks and column tops in sync")
+        test_collision_and_drop_match_reference()
+        print("✓ Collision checks and drop distances match the step-by-step reference")
+        test_kernel_warm_up_matches_drop_distance_types()
+        print("✓ Kernel warm-up uses the same argument types as drop_distance")
+        print("\n✅ All board tests passed!")
+    except Exception as e:
+        print(f"\n❌ Error: {e!r}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
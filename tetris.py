@@ -4,8 +4,8 @@ Tetris Game in Python with Pygame
 
 How to run:
 -----------
-1. Install Pygame: pip install pygame
-2. Run the game:   python tetris.py
+1. Install dependencies: pip install pygame numpy
+2. Run the game:         python tetris.py
 
 Controls:
 ---------
@@ -19,9 +19,13 @@ Controls:
 - ESC:         Quit
 """
 
+import itertools
+import numpy as np
 import pygame
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from tetris_kernels import drop_distance_nb
 
 # =============================================================================
 # CONSTANTS
@@ -37,6 +41,10 @@ SIDEBAR_WIDTH = 150
 WINDOW_WIDTH = BOARD_WIDTH * CELL_SIZE + SIDEBAR_WIDTH
 WINDOW_HEIGHT = BOARD_HEIGHT * CELL_SIZE
 
+# Screen regions, used for dirty-rectangle updates
+BOARD_RECT = pygame.Rect(0, 0, BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE)
+SIDEBAR_RECT = pygame.Rect(BOARD_WIDTH * CELL_SIZE, 0, SIDEBAR_WIDTH, WINDOW_HEIGHT)
+
 # Colors (RGB) - Chiikawa soft aesthetic
 BLACK = (245, 245, 245)        # Off-white (soft background)
 WHITE = (80, 80, 80)           # Dark gray (for text visibility)
@@ -59,6 +67,13 @@ FALL_SPEED = 500          # Normal fall speed
 SOFT_DROP_SPEED = 50      # Speed when holding down
 LOCK_DELAY = 500          # Delay before piece locks
 
+# Keyboard auto-repeat (milliseconds)
+KEY_REPEAT_DELAY = 170    # Hold time before a key starts repeating
+KEY_REPEAT_INTERVAL = 50  # Time between repeats while held
+
+# Keys that act once per press even while auto-repeat is enabled
+NON_REPEATING_KEYS = (pygame.K_UP, pygame.K_SPACE, pygame.K_p, pygame.K_r)
+
 # =============================================================================
 # PIECE DEFINITIONS
 # =============================================================================
@@ -110,6 +125,53 @@ TETROMINOES = {
     ],
 }
 
+# Every ordering of the 7-bag, so refilling the bag is a single random pick
+BAG_PERMS = list(itertools.permutations(TETROMINOES))
+
+# Board cells store a small integer id per piece type (0 means empty)
+TYPE_TO_ID = {piece_type: i for i, piece_type in enumerate(TETROMINOES, start=1)}
+
+# Cell colors indexed by piece type id, with the 3D-effect shades precomputed
+COLORS_BY_ID = (BLACK,) + tuple(COLORS[piece_type] for piece_type in TYPE_TO_ID)
+HIGHLIGHTS_BY_ID = tuple(tuple(min(c + 50, 255) for c in color) for color in COLORS_BY_ID)
+SHADOWS_BY_ID = tuple(tuple(max(c - 50, 0) for c in color) for color in COLORS_BY_ID)
+
+
+def _build_row_masks(cells: List[Tuple[int, int]]) -> Tuple[int, int, Tuple[Tuple[int, int], ...]]:
+    """Encode a rotation state as (min_dc, max_dc, ((dr, bits), ...)).
+
+    Bit i of ``bits`` is set when the piece occupies column ``min_dc + i`` of
+    row ``dr``, so ``bits << (col + min_dc)`` lines up with a board row mask.
+    """
+    min_dc = min(dc for _, dc in cells)
+    max_dc = max(dc for _, dc in cells)
+    rows = {}
+    for dr, dc in cells:
+        rows[dr] = rows.get(dr, 0) | (1 << (dc - min_dc))
+    return min_dc, max_dc, tuple(sorted(rows.items()))
+
+
+# Cell offsets as tuples per rotation, for building absolute cell positions
+TETROMINO_CELLS = {
+    piece_type: tuple(tuple(cells) for cells in rotations)
+    for piece_type, rotations in TETROMINOES.items()
+}
+
+# Cell offsets indexed by [type id, rotation] (id 0 is unused), for the drop kernel
+PIECE_OFFSETS = np.array([[[(0, 0)] * 4] * 4] + list(TETROMINOES.values()), dtype=np.int8)
+
+
+def kernel_cells(piece_type: str, row: int, col: int, rotation: int) -> np.ndarray:
+    """Get absolute cell positions as the (4, 2) int32 array the drop kernel takes."""
+    return PIECE_OFFSETS[TYPE_TO_ID[piece_type], rotation] + np.array([row, col], dtype=np.int32)
+
+
+# Row bitmasks for every rotation state, used for fast collision checks
+PIECE_ROW_MASKS = {
+    piece_type: [_build_row_masks(cells) for cells in rotations]
+    for piece_type, rotations in TETROMINOES.items()
+}
+
 
 # =============================================================================
 # PIECE CLASS
@@ -118,9 +180,11 @@ TETROMINOES = {
 class Piece:
     """Represents a falling Tetris piece."""
 
+    __slots__ = ('type', 'rotations', 'rotation_index', 'color', 'image', 'row', 'col')
+
     def __init__(self, piece_type: str, image: Optional[pygame.Surface] = None):
         self.type = piece_type
-        self.rotations = TETROMINOES[piece_type]
+        self.rotations = TETROMINO_CELLS[piece_type]
         self.rotation_index = 0
         self.color = COLORS[piece_type]
         self.image = image
@@ -129,19 +193,16 @@ class Piece:
         self.row = 0
         self.col = BOARD_WIDTH // 2 - 2
 
-    def get_cells(self) -> List[Tuple[int, int]]:
+    def get_cells(self) -> Tuple[Tuple[int, int], ...]:
         """Get the absolute board positions of all cells in this piece."""
-        cells = []
-        for dr, dc in self.rotations[self.rotation_index]:
-            cells.append((self.row + dr, self.col + dc))
-        return cells
+        return self.get_cells_at(self.row, self.col, self.rotation_index)
 
-    def get_cells_at(self, row: int, col: int, rotation: int) -> List[Tuple[int, int]]:
+    def get_cells_at(self, row: int, col: int, rotation: int) -> Tuple[Tuple[int, int], ...]:
         """Get cells at a hypothetical position and rotation."""
-        cells = []
-        for dr, dc in self.rotations[rotation]:
-            cells.append((row + dr, col + dc))
-        return cells
+        # Unrolled over the four cells; faster than a loop or comprehension
+        (r0, c0), (r1, c1), (r2, c2), (r3, c3) = self.rotations[rotation]
+        return ((row + r0, col + c0), (row + r1, col + c1),
+                (row + r2, col + c2), (row + r3, col + c3))
 
     def rotate_cw(self) -> int:
         """Return the next clockwise rotation index."""
@@ -159,103 +220,153 @@ class Piece:
 class Board:
     """Represents the Tetris game board."""
 
-    def __init__(self):
-        # Grid stores piece type strings or None for empty cells
-        # grid[row][col], row 0 is top
-        self.grid: List[List[Optional[str]]] = [
-            [None for _ in range(BOARD_WIDTH)]
-            for _ in range(BOARD_HEIGHT)
-        ]
+    __slots__ = ('grid', 'row_masks', 'col_tops')
 
-    def is_valid_position(self, cells: List[Tuple[int, int]]) -> bool:
-        """Check if all cells are within bounds and not occupied."""
-        for row, col in cells:
-            # Check horizontal bounds
-            if col < 0 or col >= BOARD_WIDTH:
-                return False
+    def __init__(self):
+        # Grid stores piece type ids (see TYPE_TO_ID) or 0 for empty cells
+        # grid[row, col], row 0 is top
+        self.grid = np.zeros((BOARD_HEIGHT, BOARD_WIDTH), dtype=np.uint8)
+        # Occupancy bitmask per row, bit c set means column c is filled
+        self.row_masks: List[int] = [0] * BOARD_HEIGHT
+        # First occupied row per column, or BOARD_HEIGHT if the column is empty
+        self.col_tops: List[int] = [BOARD_HEIGHT] * BOARD_WIDTH
+
+    def is_valid_position(self, piece_type: str, row: int, col: int, rotation: int) -> bool:
+        """Check if a piece fits within bounds and over unoccupied cells."""
+        min_dc, max_dc, piece_rows = PIECE_ROW_MASKS[piece_type][rotation]
+        # Check horizontal bounds
+        if col + min_dc < 0 or col + max_dc >= BOARD_WIDTH:
+            return False
+        shift = col + min_dc
+        row_masks = self.row_masks
+        for dr, bits in piece_rows:
+            r = row + dr
             # Check vertical bounds (allow above top for spawning)
-            if row >= BOARD_HEIGHT:
+            if r >= BOARD_HEIGHT:
                 return False
-            # Check if cell is occupied (only for visible rows)
-            if row >= 0 and self.grid[row][col] is not None:
+            # Check if any cell is occupied (only for visible rows)
+            if r >= 0 and row_masks[r] & (bits << shift):
                 return False
         return True
 
+    def drop_distance(self, piece_type: str, row: int, col: int, rotation: int) -> int:
+        """Return how many rows a piece can fall from the given valid position."""
+        # When every cell is above its column's stack, each one lands on top of it
+        tops = self.col_tops
+        gap = min(tops[col + dc] - row - dr
+                  for dr, dc in TETROMINO_CELLS[piece_type][rotation]) - 1
+        if gap >= 0:
+            return gap
+
+        # The piece is tucked under an overhang, so step down through the grid
+        return drop_distance_nb(self.grid, kernel_cells(piece_type, row, col, rotation))
+
     def lock_piece(self, piece: Piece) -> None:
         """Lock a piece onto the board."""
+        piece_id = TYPE_TO_ID[piece.type]
         for row, col in piece.get_cells():
             if 0 <= row < BOARD_HEIGHT and 0 <= col < BOARD_WIDTH:
-                self.grid[row][col] = piece.type
+                self.grid[row, col] = piece_id
+                self.row_masks[row] |= 1 << col
+                if row < self.col_tops[col]:
+                    self.col_tops[col] = row
 
     def clear_lines(self) -> int:
         """Clear completed lines and return the number of lines cleared."""
-        lines_cleared = 0
-        row = BOARD_HEIGHT - 1
-
-        while row >= 0:
-            # Check if row is complete
-            if all(cell is not None for cell in self.grid[row]):
-                lines_cleared += 1
-                # Remove the row
-                del self.grid[row]
-                # Add empty row at top
-                self.grid.insert(0, [None for _ in range(BOARD_WIDTH)])
-                # Don't decrement row - check same position again
-            else:
-                row -= 1
+        full = (self.grid != 0).all(axis=1)
+        lines_cleared = int(full.sum())
+        # Most locks clear nothing, so leave the grid untouched
+        if not lines_cleared:
+            return 0
+
+        # Drop the full rows and pad with empty rows at the top
+        kept = self.grid[~full]
+        self.grid = np.concatenate([
+            np.zeros((lines_cleared, BOARD_WIDTH), dtype=np.uint8),
+            kept,
+        ])
+        self.row_masks = [0] * lines_cleared + [
+            mask for mask, is_full in zip(self.row_masks, full.tolist()) if not is_full
+        ]
+        occupied = self.grid != 0
+        self.col_tops = np.where(
+            occupied.any(axis=0), occupied.argmax(axis=0), BOARD_HEIGHT
+        ).tolist()
 
         return lines_cleared
 
-    def draw(self, surface: pygame.Surface, piece_images: dict = None) -> None:
+    def draw(self, surface: pygame.Surface, cells_by_id: Tuple[Optional[pygame.Surface], ...],
+             background: pygame.Surface) -> None:
         """Draw the board grid and locked pieces."""
-        # Draw background
-        board_rect = pygame.Rect(0, 0, BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE)
-        pygame.draw.rect(surface, BLACK, board_rect)
+        # Draw pre-rendered background and grid lines
+        surface.blit(background, (0, 0))
+
+        # Draw locked pieces in a single batched blit call
+        rows, cols = np.nonzero(self.grid)
+        piece_ids = self.grid[rows, cols]
+        surface.blits(
+            [
+                (cells_by_id[piece_id], (col * CELL_SIZE, row * CELL_SIZE))
+                for row, col, piece_id in zip(rows.tolist(), cols.tolist(), piece_ids.tolist())
+            ],
+            doreturn=False,
+        )
+
+    @staticmethod
+    def render_background() -> pygame.Surface:
+        """Pre-render the empty board background with its grid lines."""
+        background = pygame.Surface((BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE)).convert()
+        background.fill(BLACK)
 
-        # Draw grid lines
         for row in range(BOARD_HEIGHT + 1):
             y = row * CELL_SIZE
-            pygame.draw.line(surface, DARK_GRAY, (0, y), (BOARD_WIDTH * CELL_SIZE, y))
+            pygame.draw.line(background, DARK_GRAY, (0, y), (BOARD_WIDTH * CELL_SIZE, y))
         for col in range(BOARD_WIDTH + 1):
             x = col * CELL_SIZE
-            pygame.draw.line(surface, DARK_GRAY, (x, 0), (x, BOARD_HEIGHT * CELL_SIZE))
-
-        # Draw locked pieces
-        for row in range(BOARD_HEIGHT):
-            for col in range(BOARD_WIDTH):
-                piece_type = self.grid[row][col]
-                if piece_type is not None:
-                    color = COLORS[piece_type]
-                    image = piece_images.get(piece_type) if piece_images else None
-                    self._draw_cell(surface, row, col, color, image)
-
-    def _draw_cell(self, surface: pygame.Surface, row: int, col: int,
-                   color: Tuple[int, int, int], image: Optional[pygame.Surface] = None) -> None:
-        """Draw a single cell with a 3D effect and optional character image."""
-        x = col * CELL_SIZE
-        y = row * CELL_SIZE
+            pygame.draw.line(background, DARK_GRAY, (x, 0), (x, BOARD_HEIGHT * CELL_SIZE))
+
+        return background
+
+    @staticmethod
+    def render_cell(piece_id: int, image: Optional[pygame.Surface] = None) -> pygame.Surface:
+        """Pre-render a single cell with a 3D effect and optional character image."""
+        cell = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+
+        # Board background and the grid lines along the cell's top/left edges
+        cell.fill(BLACK)
+        pygame.draw.line(cell, DARK_GRAY, (0, 0), (CELL_SIZE - 1, 0))
+        pygame.draw.line(cell, DARK_GRAY, (0, 0), (0, CELL_SIZE - 1))
 
         # Main cell
-        rect = pygame.Rect(x + 1, y + 1, CELL_SIZE - 2, CELL_SIZE - 2)
-        pygame.draw.rect(surface, color, rect)
+        rect = pygame.Rect(1, 1, CELL_SIZE - 2, CELL_SIZE - 2)
+        pygame.draw.rect(cell, COLORS_BY_ID[piece_id], rect)
 
         # Highlight (top-left)
-        highlight = tuple(min(c + 50, 255) for c in color)
-        pygame.draw.line(surface, highlight, (x + 1, y + 1), (x + CELL_SIZE - 2, y + 1))
-        pygame.draw.line(surface, highlight, (x + 1, y + 1), (x + 1, y + CELL_SIZE - 2))
+        highlight = HIGHLIGHTS_BY_ID[piece_id]
+        pygame.draw.line(cell, highlight, (1, 1), (CELL_SIZE - 2, 1))
+        pygame.draw.line(cell, highlight, (1, 1), (1, CELL_SIZE - 2))
 
         # Shadow (bottom-right)
-        shadow = tuple(max(c - 50, 0) for c in color)
-        pygame.draw.line(surface, shadow, (x + 1, y + CELL_SIZE - 2),
-                        (x + CELL_SIZE - 2, y + CELL_SIZE - 2))
-        pygame.draw.line(surface, shadow, (x + CELL_SIZE - 2, y + 1),
-                        (x + CELL_SIZE - 2, y + CELL_SIZE - 2))
+        shadow = SHADOWS_BY_ID[piece_id]
+        pygame.draw.line(cell, shadow, (1, CELL_SIZE - 2), (CELL_SIZE - 2, CELL_SIZE - 2))
+        pygame.draw.line(cell, shadow, (CELL_SIZE - 2, 1), (CELL_SIZE - 2, CELL_SIZE - 2))
 
         # Draw character image centered on the cell
         if image:
             img_rect = image.get_rect()
-            img_rect.center = (x + CELL_SIZE // 2, y + CELL_SIZE // 2)
-            surface.blit(image, img_rect)
+            img_rect.center = (CELL_SIZE // 2, CELL_SIZE // 2)
+            cell.blit(image, img_rect)
+
+        return cell
+
+
+def warm_up_kernels() -> None:
+    """Compile the drop kernel now rather than on first use mid-game.
+
+    Passes an empty board's grid and a kernel_cells array, the same argument
+    types Board.drop_distance uses, so Numba doesn't compile again later.
+    """
+    drop_distance_nb(Board().grid, kernel_cells('I', 0, 0, 0))
 
 
 # =============================================================================
@@ -270,12 +381,14 @@ class Game:
         pygame.display.set_caption("Chiikawa Tetris")
 
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
 
         # Load Chiikawa character images
         self.piece_images = {}
+        self.piece_images_preview = {}
         image_files = {
             'I': 'images/chiikawa.png',
             'O': 'images/hachiware.png',
@@ -288,12 +401,40 @@ class Game:
 
         for piece_type, filepath in image_files.items():
             try:
-                img = pygame.image.load(filepath)
-                img = pygame.transform.smoothscale(img, (20, 20))
+                # Convert to the display's pixel format so blits skip per-pixel conversion
+                img = pygame.image.load(filepath).convert_alpha()
+                img = pygame.transform.smoothscale(img, (20, 20)).convert_alpha()
                 self.piece_images[piece_type] = img
+                # Smaller variant for the next piece preview
+                self.piece_images_preview[piece_type] = (
+                    pygame.transform.smoothscale(img, (16, 16)).convert_alpha()
+                )
             except Exception as e:
                 print(f"Warning: Could not load {filepath}: {e}")
                 self.piece_images[piece_type] = None
+                self.piece_images_preview[piece_type] = None
+
+        # Pre-render one cell surface per piece type (blitted instead of redrawn),
+        # indexed by piece type id like the board grid (id 0 is empty)
+        self.cells_by_id = (None,) + tuple(
+            Board.render_cell(piece_id, self.piece_images.get(piece_type))
+            for piece_type, piece_id in TYPE_TO_ID.items()
+        )
+
+        # Pre-render the parts of the screen that never change
+        self._board_bg = Board.render_background()
+        self._sidebar_static = self._render_sidebar_static()
+        self._pause_overlay = self._render_overlay("PAUSED", "Press P to resume")
+        self._gameover_overlay = self._render_overlay("GAME OVER", "Press R to restart")
+
+        # Last rendered (value, surface) per sidebar text, re-rendered on change
+        self._cached_text: Dict[str, Tuple[object, pygame.Surface]] = {}
+
+        # Non-repeating keys currently held down
+        self._held_keys = set()
+
+        # Compile the overhang fallback kernel now rather than on first use mid-game
+        warm_up_kernels()
 
         self.reset_game()
 
@@ -308,6 +449,12 @@ class Game:
         self.game_over = False
         self.paused = False
 
+        # Screen regions that changed since the last draw
+        self._dirty: List[pygame.Rect] = [self.screen.get_rect()]
+
+        # (piece, row, col, rotation, d_col) of the last sideways move that was blocked
+        self._blocked_shift: Optional[tuple] = None
+
         # Timing
         self.last_fall_time = pygame.time.get_ticks()
         self.fall_speed = FALL_SPEED
@@ -321,8 +468,7 @@ class Game:
     def get_next_piece_type(self) -> str:
         """Get next piece type using 7-bag randomization."""
         if not self.piece_bag:
-            self.piece_bag = list(TETROMINOES.keys())
-            random.shuffle(self.piece_bag)
+            self.piece_bag = list(BAG_PERMS[random.randrange(len(BAG_PERMS))])
         return self.piece_bag.pop()
 
     def spawn_piece(self) -> bool:
@@ -336,7 +482,9 @@ class Game:
         self.next_piece = Piece(piece_type, self.piece_images.get(piece_type))
 
         # Check if the spawn position is valid
-        if not self.board.is_valid_position(self.current_piece.get_cells()):
+        piece = self.current_piece
+        if not self.board.is_valid_position(piece.type, piece.row, piece.col,
+                                            piece.rotation_index):
             self.game_over = True
             return False
 
@@ -348,16 +496,36 @@ class Game:
         if self.current_piece is None:
             return False
 
-        new_cells = self.current_piece.get_cells_at(
+        if self.board.is_valid_position(
+            self.current_piece.type,
             self.current_piece.row + d_row,
             self.current_piece.col + d_col,
             self.current_piece.rotation_index
-        )
-
-        if self.board.is_valid_position(new_cells):
+        ):
+            self._mark_piece_dirty()
             self.current_piece.row += d_row
             self.current_piece.col += d_col
+            self._mark_piece_dirty()
+            return True
+        return False
+
+    def shift_piece(self, d_col: int) -> bool:
+        """Move the current piece sideways. Returns True if successful.
+
+        While a direction is held against a wall or the stack, repeated moves
+        are skipped until the piece changes position or rotation.
+        """
+        piece = self.current_piece
+        if piece is None:
+            return False
+
+        state = (piece, piece.row, piece.col, piece.rotation_index, d_col)
+        if state == self._blocked_shift:
+            return False
+
+        if self.move_piece(0, d_col):
             return True
+        self._blocked_shift = state
         return False
 
     def rotate_piece(self, clockwise: bool = True) -> bool:
@@ -369,26 +537,29 @@ class Game:
                        else self.current_piece.rotate_ccw())
 
         # Try rotation at current position
-        new_cells = self.current_piece.get_cells_at(
+        if self.board.is_valid_position(
+            self.current_piece.type,
             self.current_piece.row,
             self.current_piece.col,
             new_rotation
-        )
-
-        if self.board.is_valid_position(new_cells):
+        ):
+            self._mark_piece_dirty()
             self.current_piece.rotation_index = new_rotation
+            self._mark_piece_dirty()
             return True
 
         # Wall kick: try shifting left/right
         for offset in [1, -1, 2, -2]:
-            new_cells = self.current_piece.get_cells_at(
+            if self.board.is_valid_position(
+                self.current_piece.type,
                 self.current_piece.row,
                 self.current_piece.col + offset,
                 new_rotation
-            )
-            if self.board.is_valid_position(new_cells):
+            ):
+                self._mark_piece_dirty()
                 self.current_piece.rotation_index = new_rotation
                 self.current_piece.col += offset
+                self._mark_piece_dirty()
                 return True
 
         return False
@@ -399,9 +570,13 @@ class Game:
             return
 
         # Count cells dropped for scoring
-        cells_dropped = 0
-        while self.move_piece(1, 0):
-            cells_dropped += 1
+        cells_dropped = self.board.drop_distance(
+            self.current_piece.type,
+            self.current_piece.row,
+            self.current_piece.col,
+            self.current_piece.rotation_index
+        )
+        self.current_piece.row += cells_dropped
 
         # Award points for hard drop
         self.score += cells_dropped * 2
@@ -414,6 +589,8 @@ class Game:
             return
 
         self.board.lock_piece(self.current_piece)
+        # Locking changes the board, score and next piece preview
+        self._dirty.append(self.screen.get_rect())
 
         # Clear lines
         lines = self.board.clear_lines()
@@ -427,28 +604,41 @@ class Game:
 
         self.spawn_piece()
 
+    def _mark_piece_dirty(self) -> None:
+        """Mark the current piece's columns, from the piece down to the floor, as dirty.
+
+        The ghost piece always sits below the current piece in the same
+        columns, so this area covers both.
+        """
+        piece = self.current_piece
+        if piece is None:
+            return
+        min_dc, max_dc, piece_rows = PIECE_ROW_MASKS[piece.type][piece.rotation_index]
+        top = max(piece.row + piece_rows[0][0], 0) * CELL_SIZE
+        self._dirty.append(pygame.Rect(
+            (piece.col + min_dc) * CELL_SIZE,
+            top,
+            (max_dc - min_dc + 1) * CELL_SIZE,
+            BOARD_HEIGHT * CELL_SIZE - top,
+        ))
+
     def calculate_score(self, lines: int) -> int:
         """Calculate score for cleared lines."""
         # Classic Tetris scoring
         scores = {1: 100, 2: 300, 3: 500, 4: 800}
         return scores.get(lines, 0) * self.level
 
-    def get_ghost_position(self) -> List[Tuple[int, int]]:
+    def get_ghost_position(self) -> Tuple[Tuple[int, int], ...]:
         """Get the position where the piece would land (ghost piece)."""
         if self.current_piece is None:
-            return []
-
-        ghost_row = self.current_piece.row
-        while True:
-            new_cells = self.current_piece.get_cells_at(
-                ghost_row + 1,
-                self.current_piece.col,
-                self.current_piece.rotation_index
-            )
-            if self.board.is_valid_position(new_cells):
-                ghost_row += 1
-            else:
-                break
+            return ()
+
+        ghost_row = self.current_piece.row + self.board.drop_distance(
+            self.current_piece.type,
+            self.current_piece.row,
+            self.current_piece.col,
+            self.current_piece.rotation_index
+        )
 
         return self.current_piece.get_cells_at(
             ghost_row,
@@ -471,9 +661,19 @@ class Game:
 
     def handle_input(self, event: pygame.event.Event) -> None:
         """Handle keyboard input."""
+        if event.type == pygame.KEYUP:
+            self._held_keys.discard(event.key)
+            return
+
         if event.type != pygame.KEYDOWN:
             return
 
+        # Ignore auto-repeat for keys that should act once per press
+        if event.key in NON_REPEATING_KEYS:
+            if event.key in self._held_keys:
+                return
+            self._held_keys.add(event.key)
+
         if event.key == pygame.K_ESCAPE:
             pygame.quit()
             exit()
@@ -485,18 +685,20 @@ class Game:
 
         if event.key == pygame.K_p:
             self.paused = not self.paused
+            self._dirty.append(BOARD_RECT)
             return
 
         if self.paused:
             return
 
         if event.key == pygame.K_LEFT:
-            self.move_piece(0, -1)
+            self.shift_piece(-1)
         elif event.key == pygame.K_RIGHT:
-            self.move_piece(0, 1)
+            self.shift_piece(1)
         elif event.key == pygame.K_DOWN:
             if self.move_piece(1, 0):
                 self.score += 1  # Soft drop bonus
+                self._dirty.append(SIDEBAR_RECT)
                 self.last_fall_time = pygame.time.get_ticks()
         elif event.key == pygame.K_UP:
             self.rotate_piece(clockwise=True)
@@ -504,135 +706,171 @@ class Game:
             self.hard_drop()
 
     def draw(self) -> None:
-        """Draw the entire game."""
-        self.screen.fill(DARK_GRAY)
-
+        """Draw the entire game and update the dirty regions of the display."""
         # Draw board
-        self.board.draw(self.screen, self.piece_images)
+        self.board.draw(self.screen, self.cells_by_id, self._board_bg)
 
         # Draw ghost piece
         if self.current_piece and not self.game_over:
             ghost_cells = self.get_ghost_position()
+            # Lock once around the outline primitives instead of once per call
+            self.screen.lock()
             for row, col in ghost_cells:
                 if row >= 0:
                     x = col * CELL_SIZE
                     y = row * CELL_SIZE
                     rect = pygame.Rect(x + 2, y + 2, CELL_SIZE - 4, CELL_SIZE - 4)
                     pygame.draw.rect(self.screen, GRAY, rect, 2)
+            self.screen.unlock()
 
         # Draw current piece
         if self.current_piece and not self.game_over:
+            cell = self.cells_by_id[TYPE_TO_ID[self.current_piece.type]]
             for row, col in self.current_piece.get_cells():
                 if row >= 0:
-                    self.board._draw_cell(self.screen, row, col,
-                                         self.current_piece.color,
-                                         self.current_piece.image)
+                    self.screen.blit(cell, (col * CELL_SIZE, row * CELL_SIZE))
 
         # Draw sidebar
         self._draw_sidebar()
 
         # Draw pause overlay
         if self.paused:
-            self._draw_overlay("PAUSED", "Press P to resume")
+            self.screen.blit(self._pause_overlay, (0, 0))
 
         # Draw game over overlay
         if self.game_over:
-            self._draw_overlay("GAME OVER", "Press R to restart")
+            self.screen.blit(self._gameover_overlay, (0, 0))
+
+        # Only push the regions that changed to the display
+        pygame.display.update(self._dirty)
+        self._dirty = []
+
+    def _render_sidebar_static(self) -> pygame.Surface:
+        """Pre-render the sidebar background, labels and controls help."""
+        sidebar = pygame.Surface((SIDEBAR_WIDTH, WINDOW_HEIGHT)).convert()
+        sidebar.fill(DARK_GRAY)
+        label_x = 10
 
-        pygame.display.flip()
+        # Labels
+        for label, y in (("Score", 20), ("Level", 100), ("Lines", 180), ("Next", 280)):
+            text = self.font.render(label, True, WHITE)
+            sidebar.blit(text, (label_x, y))
+
+        # Controls help
+        controls = [
+            "Controls:",
+            "← → Move",
+            "↓ Soft drop",
+            "↑ Rotate",
+            "Space Hard drop",
+            "P Pause",
+        ]
+        y = 420
+        for line in controls:
+            text = self.small_font.render(line, True, GRAY)
+            sidebar.blit(text, (label_x, y))
+            y += 22
+
+        return sidebar
+
+    def _render_cached(self, key: str, value: object, font: pygame.font.Font,
+                       color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render a value as text, reusing the last surface if it hasn't changed."""
+        last = self._cached_text.get(key)
+        if last and last[0] == value:
+            return last[1]
+        surface = font.render(str(value), True, color)
+        self._cached_text[key] = (value, surface)
+        return surface
 
     def _draw_sidebar(self) -> None:
         """Draw the sidebar with score and next piece."""
         sidebar_x = BOARD_WIDTH * CELL_SIZE + 10
 
-        # Score
-        score_text = self.font.render("Score", True, WHITE)
-        self.screen.blit(score_text, (sidebar_x, 20))
-        score_value = self.font.render(str(self.score), True, WHITE)
-        self.screen.blit(score_value, (sidebar_x, 50))
+        # Static background, labels and controls help
+        self.screen.blit(self._sidebar_static, (BOARD_WIDTH * CELL_SIZE, 0))
 
-        # Level
-        level_text = self.font.render("Level", True, WHITE)
-        self.screen.blit(level_text, (sidebar_x, 100))
-        level_value = self.font.render(str(self.level), True, WHITE)
+        # Score, level and lines values
+        score_value = self._render_cached("score", self.score, self.font, WHITE)
+        self.screen.blit(score_value, (sidebar_x, 50))
+        level_value = self._render_cached("level", self.level, self.font, WHITE)
         self.screen.blit(level_value, (sidebar_x, 130))
-
-        # Lines
-        lines_text = self.font.render("Lines", True, WHITE)
-        self.screen.blit(lines_text, (sidebar_x, 180))
-        lines_value = self.font.render(str(self.lines_cleared), True, WHITE)
+        lines_value = self._render_cached("lines", self.lines_cleared, self.font, WHITE)
         self.screen.blit(lines_value, (sidebar_x, 210))
 
-        # Next piece
-        next_text = self.font.render("Next", True, WHITE)
-        self.screen.blit(next_text, (sidebar_x, 280))
-
         if self.next_piece:
             # Draw next piece preview
             preview_x = sidebar_x + 20
             preview_y = 320
-            for dr, dc in self.next_piece.rotations[0]:
-                x = preview_x + dc * 20
-                y = preview_y + dr * 20
-                # Draw colored background
+            positions = [
+                (preview_x + dc * 20, preview_y + dr * 20)
+                for dr, dc in self.next_piece.rotations[0]
+            ]
+
+            # Draw colored backgrounds under a single lock (blits need it released)
+            self.screen.lock()
+            for x, y in positions:
                 rect = pygame.Rect(x, y, 18, 18)
                 pygame.draw.rect(self.screen, self.next_piece.color, rect)
-                # Draw character image if available
-                if self.next_piece.image:
-                    scaled_img = pygame.transform.smoothscale(self.next_piece.image, (16, 16))
+            self.screen.unlock()
+
+            # Draw character images if available
+            scaled_img = self.piece_images_preview.get(self.next_piece.type)
+            if scaled_img:
+                for x, y in positions:
                     img_rect = scaled_img.get_rect()
                     img_rect.center = (x + 9, y + 9)
                     self.screen.blit(scaled_img, img_rect)
 
-        # Controls help
-        controls = [
-            "Controls:",
-            "← → Move",
-            "↓ Soft drop",
-            "↑ Rotate",
-            "Space Hard drop",
-            "P Pause",
-        ]
-        y = 420
-        for line in controls:
-            text = self.small_font.render(line, True, GRAY)
-            self.screen.blit(text, (sidebar_x, y))
-            y += 22
-
-    def _draw_overlay(self, title: str, subtitle: str) -> None:
-        """Draw a semi-transparent overlay with text."""
+    def _render_overlay(self, title: str, subtitle: str) -> pygame.Surface:
+        """Pre-render a semi-transparent board overlay with text."""
         # Semi-transparent background
-        overlay = pygame.Surface((BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE))
-        overlay.fill(BLACK)
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        overlay = pygame.Surface(
+            (BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE), pygame.SRCALPHA
+        ).convert_alpha()
+        overlay.fill((*BLACK, 180))
 
         # Title
         title_text = self.font.render(title, True, WHITE)
         title_rect = title_text.get_rect(
             center=(BOARD_WIDTH * CELL_SIZE // 2, BOARD_HEIGHT * CELL_SIZE // 2 - 20)
         )
-        self.screen.blit(title_text, title_rect)
+        overlay.blit(title_text, title_rect)
 
         # Subtitle
         subtitle_text = self.small_font.render(subtitle, True, GRAY)
         subtitle_rect = subtitle_text.get_rect(
             center=(BOARD_WIDTH * CELL_SIZE // 2, BOARD_HEIGHT * CELL_SIZE // 2 + 20)
         )
-        self.screen.blit(subtitle_text, subtitle_rect)
+        overlay.blit(subtitle_text, subtitle_rect)
+
+        return overlay
 
     def run(self) -> None:
         """Main game loop."""
         running = True
 
         while running:
-            for event in pygame.event.get():
+            if (self.paused or self.game_over) and not self._dirty:
+                # The overlay is already on screen and nothing changes until
+                # the next key press, so sleep until an event arrives
+                events = [pygame.event.wait()] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                    pygame.WINDOWRESTORED):
+                    # The window was uncovered or restored, so repaint all of it
+                    self._dirty.append(self.screen.get_rect())
                 self.handle_input(event)
 
             self.update()
-            self.draw()
+            # Nothing changed this tick (e.g. waiting to fall, paused)
+            if self._dirty:
+                self.draw()
             self.clock.tick(60)  # 60 FPS
 
         pygame.quit()
@@ -0,0 +1,44 @@
+"""
+JIT-compiled drop kernel for the Tetris board.
+
+These operate on the raw NumPy board grid (uint8, 0 means empty) and a
+(4, 2) int32 array of absolute (row, col) cell positions. Numba is used
+when it is installed; otherwise the same functions run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _cells_fit(grid, cells, d_row):
+    """Check if the cells, shifted down by d_row, are in bounds and unoccupied."""
+    height, width = grid.shape
+    for i in range(cells.shape[0]):
+        row = cells[i, 0] + d_row
+        col = cells[i, 1]
+        # Check horizontal bounds
+        if col < 0 or col >= width:
+            return False
+        # Check vertical bounds (allow above top for spawning)
+        if row >= height:
+            return False
+        # Check if cell is occupied (only for visible rows)
+        if row >= 0 and grid[row, col] != 0:
+            return False
+    return True
+
+
+@njit(cache=True)
+def drop_distance_nb(grid, cells):
+    """Return how many rows the cells can fall before they collide."""
+    distance = 0
+    while _cells_fit(grid, cells, distance + 1):
+        distance += 1
+    return distance